@@ -7,8 +7,17 @@ AI-assisted development. Zero dependencies beyond Python stdlib.
 
 Usage:
     python scaffold.py
+    python scaffold.py --name seismic-analysis --type "Data pipeline" --ai "Claude Code"
+
+Any options not given on the command line are asked for interactively.
 """
 
+from __future__ import annotations
+
+import argparse
+import os
+import re
+from datetime import date
 from pathlib import Path
 
 
@@ -36,26 +45,59 @@ def prompt_choice(question: str, options: list[str]) -> str:
         print(f"Please enter a number between 1 and {len(options)}")
 
 
-def gather_inputs() -> dict:
-    """Gather project information from user."""
+PROJECT_TYPES = ["Data pipeline", "Analysis tool", "Algorithm implementation", "General"]
+AI_TOOLS = ["Claude Code", "Cursor", "GitHub Copilot", "Other/None"]
+DEFAULT_DESCRIPTION = "A spec-driven scientific project"
+
+# A single, portable directory name: no separators, no leading dot
+_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]*")
+NAME_RULES = "Project name must start with a letter or digit and use only letters, digits, '.', '_' or '-'."
+
+
+def _validate_name(name: str) -> bool:
+    """Return True if name is safe to use as the project directory name."""
+    return _NAME_PATTERN.fullmatch(name) is not None
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options for non-interactive use."""
+    parser = argparse.ArgumentParser(description="Scaffold a spec-driven project.")
+    parser.add_argument("--name", help="project name (also the directory name)")
+    parser.add_argument("--description", help="one-line description")
+    parser.add_argument("--type", dest="project_type", choices=PROJECT_TYPES, help="project type")
+    parser.add_argument("--ai", dest="ai_tool", choices=AI_TOOLS, help="primary AI coding assistant")
+    args = parser.parse_args()
+    if args.name is not None and not _validate_name(args.name):
+        parser.error(NAME_RULES)
+    return args
+
+
+def gather_inputs(args: argparse.Namespace) -> dict:
+    """Gather project information, prompting for anything not given in args."""
+    if args.name and args.project_type and args.ai_tool:
+        return {
+            "name": args.name,
+            "description": DEFAULT_DESCRIPTION if args.description is None else args.description,
+            "project_type": args.project_type,
+            "ai_tool": args.ai_tool,
+        }
+
     print("\n=== Spec-Driven Project Scaffolder ===\n")
 
-    name = prompt("Project name (e.g., seismic-analysis)")
-    while not name:
-        print("Project name is required.")
+    name = args.name
+    if not name:
+        name = prompt("Project name (e.g., seismic-analysis)")
+    while not _validate_name(name):
+        print(NAME_RULES if name else "Project name is required.")
         name = prompt("Project name")
 
-    description = prompt("One-line description", "A spec-driven scientific project")
+    description = args.description
+    if description is None:
+        description = prompt("One-line description", DEFAULT_DESCRIPTION)
 
-    project_type = prompt_choice(
-        "Project type:",
-        ["Data pipeline", "Analysis tool", "Algorithm implementation", "General"]
-    )
+    project_type = args.project_type or prompt_choice("Project type:", PROJECT_TYPES)
 
-    ai_tool = prompt_choice(
-        "Primary AI coding assistant:",
-        ["Claude Code", "Cursor", "GitHub Copilot", "Other/None"]
-    )
+    ai_tool = args.ai_tool or prompt_choice("Primary AI coding assistant:", AI_TOOLS)
 
     return {
         "name": name,
@@ -69,6 +111,28 @@ def gather_inputs() -> dict:
 # Template Content
 # =============================================================================
 
+def _compile_template(text: str, *fields: str) -> tuple[bytes, tuple[str, ...]]:
+    """Compile text with {field} placeholders into a bytes %-format and field order.
+
+    Every {identifier} in text is a placeholder, so templates cannot contain
+    literal {identifier} sequences. Unknown placeholders fail at import time.
+    """
+    pieces = re.split(r"\{(\w+)\}", text)
+    names = tuple(pieces[1::2])
+    unknown = set(names) - set(fields)
+    if unknown:
+        raise ValueError(f"Unknown template placeholders: {sorted(unknown)}")
+    literals = [p.replace("%", "%%").encode("utf-8") for p in pieces[0::2]]
+    return b"%b".join(literals), names
+
+
+def _render(template: tuple[bytes, tuple[str, ...]], **fields: str) -> bytes:
+    """Fill a compiled template's placeholders with the UTF-8 field values."""
+    fmt, names = template
+    return fmt % tuple([fields[name].encode("utf-8") for name in names])
+
+
+# Contains non-ASCII punctuation, so encoded once here rather than as a b"" literal
 SPEC_FORMAT = """\
 # Spec Format Guide
 
@@ -143,10 +207,13 @@ Each spec should end with a change record:
 - YYYY-MM-DD: Initial draft
 - YYYY-MM-DD: Added edge case handling per review feedback
 ```
-"""
+""".encode("utf-8")
+
+# Today's date as YYYY-MM-DD for the overview's change record. Deliberately
+# fixed at import: a long-running batch may stamp a date from before midnight.
+_TODAY = date.today().isoformat()
 
-def overview_template(name: str, description: str) -> str:
-    return f"""\
+_OVERVIEW = _compile_template("""\
 # {name}
 
 **Status**: Draft
@@ -182,11 +249,15 @@ Delete these instructions once you've written the overview.
 
 ## Change Record
 
-- {_today()}: Initial draft
-"""
+- {today}: Initial draft
+""", "name", "description", "today")
+
+
+def overview_template(name: str, description: str) -> bytes:
+    return _render(_OVERVIEW, name=name, description=description, today=_TODAY)
 
 
-FUNCTIONAL_REQUIREMENTS = """\
+FUNCTIONAL_REQUIREMENTS = b"""\
 # Functional Requirements
 
 **Status**: Draft
@@ -239,7 +310,7 @@ Delete these instructions once you've got the hang of it.
 """
 
 
-ADR_TEMPLATE = """\
+ADR_TEMPLATE = b"""\
 # ADR-000: Decision Record Template
 
 **Status**: Template
@@ -299,7 +370,7 @@ Delete these instructions when writing a real ADR.
 """
 
 
-DATA_FLOW_TEMPLATE = """\
+DATA_FLOW_TEMPLATE = b"""\
 # Data Flow Architecture
 
 **Status**: Draft
@@ -349,7 +420,7 @@ Delete these instructions once you've documented your data flow.
 """
 
 
-ALGORITHM_SPEC_TEMPLATE = """\
+ALGORITHM_SPEC_TEMPLATE = b"""\
 # Algorithm: [Name]
 
 **Status**: Draft
@@ -408,7 +479,7 @@ Delete these instructions once you've documented the algorithm.
 """
 
 
-VALIDATION_SPEC_TEMPLATE = """\
+VALIDATION_SPEC_TEMPLATE = b"""\
 # Validation Plan
 
 **Status**: Draft
@@ -456,8 +527,7 @@ Delete these instructions once you've documented your validation plan.
 """
 
 
-def readme_template(name: str, description: str) -> str:
-    return f"""\
+_README = _compile_template("""\
 # {name}
 
 {description}
@@ -497,11 +567,14 @@ This project uses **spec-driven development**:
 4. Update specs as requirements evolve
 
 See [spec-driven.science](https://spec-driven.science) for more on this approach.
-"""
+""", "name", "description")
+
+
+def readme_template(name: str, description: str) -> bytes:
+    return _render(_README, name=name, description=description)
 
 
-def contributing_template(name: str) -> str:
-    return f"""\
+_CONTRIBUTING = _compile_template("""\
 # Contributing to {name}
 
 ## Development Approach
@@ -540,11 +613,14 @@ edge case handling for empty windows.
 ## Questions?
 
 Open an issue for discussion before starting significant work.
-"""
+""", "name")
+
 
+def contributing_template(name: str) -> bytes:
+    return _render(_CONTRIBUTING, name=name)
 
-def claude_md_template(name: str) -> str:
-    return f"""\
+
+_CLAUDE_MD = _compile_template("""\
 # Project: {name}
 
 ## Overview
@@ -573,11 +649,14 @@ This is a spec-driven scientific project. Specifications live in the `specs/` di
 ## Spec Format
 
 See `specs/spec-format.md` for how specifications are written in this project.
-"""
+""", "name")
+
 
+def claude_md_template(name: str) -> bytes:
+    return _render(_CLAUDE_MD, name=name)
 
-def cursorrules_template(name: str) -> str:
-    return f"""\
+
+_CURSORRULES = _compile_template("""\
 # Project: {name}
 
 This is a spec-driven scientific project.
@@ -599,11 +678,14 @@ This is a spec-driven scientific project.
 ## Spec Format
 
 See `specs/spec-format.md` for specification conventions.
-"""
+""", "name")
 
 
-def copilot_instructions_template(name: str) -> str:
-    return f"""\
+def cursorrules_template(name: str) -> bytes:
+    return _render(_CURSORRULES, name=name)
+
+
+_COPILOT_INSTRUCTIONS = _compile_template("""\
 # Project: {name}
 
 This is a spec-driven scientific project. Specifications in `specs/` define what should be built.
@@ -621,19 +703,81 @@ This is a spec-driven scientific project. Specifications in `specs/` define what
 - `specs/` — Specifications (requirements, architecture, decisions)
 - `src/` — Source code
 - `tests/` — Test code
-"""
+""", "name")
 
 
-def _today() -> str:
-    """Return today's date as YYYY-MM-DD."""
-    from datetime import date
-    return date.today().isoformat()
+def copilot_instructions_template(name: str) -> bytes:
+    return _render(_COPILOT_INSTRUCTIONS, name=name)
 
 
 # =============================================================================
 # Scaffolding Logic
 # =============================================================================
 
+# AI tool -> (subdirectory or None for the project root, filename, template,
+#             text following "is ready" in the next-steps message)
+_AI_CONFIGS = {
+    "Claude Code": (".claude", "CLAUDE.md", claude_md_template,
+                    " — Claude Code will read it automatically."),
+    "Cursor": (None, ".cursorrules", cursorrules_template,
+               " — Cursor will read it automatically."),
+    "GitHub Copilot": (".github", "copilot-instructions.md", copilot_instructions_template,
+                       " for Copilot."),
+}
+
+# Directory file descriptors are unavailable on some platforms (e.g. Windows)
+_DIR_FD_SUPPORTED = os.open in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
+def _write_raw(path: str, content: bytes, dir_fd: int | None = None) -> None:
+    """Write content to path unbuffered, retrying until every byte is written."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666, dir_fd=dir_fd)
+    try:
+        view = memoryview(content)
+        while view:
+            written = os.write(fd, view)
+            if not written:
+                raise OSError(f"Could not write {path}: no bytes written")
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _write_files(directory: str, files: list[tuple[str, bytes]]) -> None:
+    """Write (filename, content) pairs into directory, resolving it only once.
+
+    A directory fd only pays off for two or more files; a single file is
+    written by full path, which costs the same path walk without the extra
+    open/close of the directory.
+    """
+    if not _DIR_FD_SUPPORTED or len(files) == 1:
+        for filename, content in files:
+            _write_raw(os.path.join(directory, filename), content)
+        return
+
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for filename, content in files:
+            _write_raw(filename, content, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _make_dirs(root: str, dirs: list[str]) -> None:
+    """Create root and every directory in dirs, one mkdir per unique path."""
+    os.makedirs(root)
+    created = {root}
+    for d in sorted(dirs, key=len):
+        missing = []
+        while d not in created:
+            missing.append(d)
+            d = os.path.dirname(d)
+        for p in reversed(missing):
+            os.mkdir(p)
+            created.add(p)
+
+
 def create_project(inputs: dict) -> Path:
     """Create the project directory structure and files."""
     name = inputs["name"]
@@ -647,55 +791,65 @@ def create_project(inputs: dict) -> Path:
         print(f"\nError: Directory '{name}' already exists.")
         raise SystemExit(1)
 
+    # Plain string paths from here on: os.path.join is much cheaper than
+    # building intermediate Path objects for every file
+    root_dir = str(root)
+    specs_dir = os.path.join(root_dir, "specs")
+    src_dir = os.path.join(root_dir, "src")
+    tests_dir = os.path.join(root_dir, "tests")
+
     # Create directory structure
     dirs = [
-        root / "specs" / "01-requirements",
-        root / "specs" / "02-architecture",
-        root / "specs" / "03-implementation",
-        root / "specs" / "99-decisions",
-        root / "src",
-        root / "tests",
+        os.path.join(specs_dir, "01-requirements"),
+        os.path.join(specs_dir, "02-architecture"),
+        os.path.join(specs_dir, "03-implementation"),
+        os.path.join(specs_dir, "99-decisions"),
+        src_dir,
+        tests_dir,
     ]
 
     # Add project-type-specific directories
     if project_type == "Algorithm implementation":
-        dirs.append(root / "specs" / "04-algorithms")
-        dirs.append(root / "specs" / "05-validation")
+        dirs.append(os.path.join(specs_dir, "04-algorithms"))
+        dirs.append(os.path.join(specs_dir, "05-validation"))
+
+    ai_config = _AI_CONFIGS.get(ai_tool)
+    if ai_config and ai_config[0]:
+        dirs.append(os.path.join(root_dir, ai_config[0]))
 
-    for d in dirs:
-        d.mkdir(parents=True, exist_ok=True)
+    _make_dirs(root_dir, dirs)
 
     # Write core spec files
-    (root / "specs" / "spec-format.md").write_text(SPEC_FORMAT)
-    (root / "specs" / "00-overview.md").write_text(overview_template(name, description))
-    (root / "specs" / "01-requirements" / "functional.md").write_text(FUNCTIONAL_REQUIREMENTS)
-    (root / "specs" / "99-decisions" / "adr-000-template.md").write_text(ADR_TEMPLATE)
+    _write_files(specs_dir, [
+        ("spec-format.md", SPEC_FORMAT),
+        ("00-overview.md", overview_template(name, description)),
+    ])
+    _write_files(os.path.join(specs_dir, "01-requirements"), [("functional.md", FUNCTIONAL_REQUIREMENTS)])
+    _write_files(os.path.join(specs_dir, "99-decisions"), [("adr-000-template.md", ADR_TEMPLATE)])
 
     # Project-type-specific files
     if project_type == "Data pipeline":
-        (root / "specs" / "02-architecture" / "data-flow.md").write_text(DATA_FLOW_TEMPLATE)
+        _write_files(os.path.join(specs_dir, "02-architecture"), [("data-flow.md", DATA_FLOW_TEMPLATE)])
 
     if project_type == "Algorithm implementation":
-        (root / "specs" / "04-algorithms" / "algorithm-template.md").write_text(ALGORITHM_SPEC_TEMPLATE)
-        (root / "specs" / "05-validation" / "validation-plan.md").write_text(VALIDATION_SPEC_TEMPLATE)
+        _write_files(os.path.join(specs_dir, "04-algorithms"), [("algorithm-template.md", ALGORITHM_SPEC_TEMPLATE)])
+        _write_files(os.path.join(specs_dir, "05-validation"), [("validation-plan.md", VALIDATION_SPEC_TEMPLATE)])
 
     # Write root files
-    (root / "README.md").write_text(readme_template(name, description))
-    (root / "CONTRIBUTING.md").write_text(contributing_template(name))
+    _write_files(root_dir, [
+        ("README.md", readme_template(name, description)),
+        ("CONTRIBUTING.md", contributing_template(name)),
+    ])
 
     # AI tool configuration
-    if ai_tool == "Claude Code":
-        (root / ".claude").mkdir(exist_ok=True)
-        (root / ".claude" / "CLAUDE.md").write_text(claude_md_template(name))
-    elif ai_tool == "Cursor":
-        (root / ".cursorrules").write_text(cursorrules_template(name))
-    elif ai_tool == "GitHub Copilot":
-        (root / ".github").mkdir(exist_ok=True)
-        (root / ".github" / "copilot-instructions.md").write_text(copilot_instructions_template(name))
+    if ai_config:
+        subdir, filename, template, _ = ai_config
+        ai_dir = os.path.join(root_dir, subdir) if subdir else root_dir
+        _write_files(ai_dir, [(filename, template(name))])
 
     # Add .gitkeep to empty directories
-    for d in [root / "src", root / "tests"]:
-        (d / ".gitkeep").touch()
+    for d in [src_dir, tests_dir]:
+        _write_files(d, [(".gitkeep", b"")])
 
     return root
 
@@ -714,18 +868,18 @@ Next steps:
   5. Start a conversation with your AI assistant about requirements
 """)
 
-    if ai_tool == "Claude Code":
-        print(f"     Your .claude/CLAUDE.md is ready — Claude Code will read it automatically.\n")
-    elif ai_tool == "Cursor":
-        print(f"     Your .cursorrules is ready — Cursor will read it automatically.\n")
-    elif ai_tool == "GitHub Copilot":
-        print(f"     Your .github/copilot-instructions.md is ready for Copilot.\n")
+    ai_config = _AI_CONFIGS.get(ai_tool)
+    if ai_config:
+        subdir, filename, _, ready_note = ai_config
+        config_path = f"{subdir}/{filename}" if subdir else filename
+        print(f"     Your {config_path} is ready{ready_note}\n")
 
 
 def main():
     """Main entry point."""
+    args = parse_args()
     try:
-        inputs = gather_inputs()
+        inputs = gather_inputs(args)
         root = create_project(inputs)
         print_next_steps(root, inputs["ai_tool"])
     except KeyboardInterrupt: